@@ -1,6 +1,6 @@
 """Climate Manager integration."""
 
-import logging
+import asyncio
 from typing import cast
 
 from homeassistant.config_entries import ConfigEntry
@@ -19,7 +19,9 @@ PLATFORMS: list[Platform] = [
 
 type HubConfigEntry = ConfigEntry[Hub]
 
-_LOGGER = logging.getLogger(__name__)
+RELOAD_DEBOUNCE_SECONDS = 0.5
+
+_reload_handles: dict[str, asyncio.TimerHandle] = {}
 
 
 async def async_setup_entry(hass: HomeAssistant, config_entry: HubConfigEntry) -> bool:
@@ -29,23 +31,20 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: HubConfigEntry) -
         config_entry.add_update_listener(_async_update_listener)
     )
 
-    zones = [
-        item
-        for item in config_entry.subentries.values()
-        if item.subentry_type == SUBENTRY_TYPE_ZONE
-    ]
-    circuits = [
-        item
-        for item in config_entry.subentries.values()
-        if item.subentry_type == SUBENTRY_TYPE_CIRCUIT
-    ]
+    zones, circuits = [], []
+    for item in config_entry.subentries.values():
+        if item.subentry_type == SUBENTRY_TYPE_ZONE:
+            zones.append(item)
+        elif item.subentry_type == SUBENTRY_TYPE_CIRCUIT:
+            circuits.append(item)
 
     hub = Hub(hass, config_entry, zones, circuits)
     config_entry.runtime_data = hub
 
     await hass.config_entries.async_forward_entry_setups(config_entry, PLATFORMS)
 
-    hub.initialize()
+    # Initialize in the background so the config entry is ready immediately
+    config_entry.async_create_task(hass, hub.async_initialize())
 
     return True
 
@@ -54,13 +53,26 @@ async def _async_update_listener(hass: HomeAssistant, config_entry: ConfigEntry)
     """Reload entities when configuration is updated."""
 
     # TODO: Find a way to remove Kp and Ki entities when PID changes to hysteresis # pylint: disable=fixme
-    await hass.config_entries.async_reload(config_entry.entry_id)
+    # A reload tears down and recreates every entity, so coalesce rapid
+    # successive config updates into a single reload.
+    entry_id = config_entry.entry_id
+    if (handle := _reload_handles.pop(entry_id, None)) is not None:
+        handle.cancel()
+
+    def _reload() -> None:
+        _reload_handles.pop(entry_id, None)
+        hass.async_create_task(hass.config_entries.async_reload(entry_id))
+
+    _reload_handles[entry_id] = hass.loop.call_later(RELOAD_DEBOUNCE_SECONDS, _reload)
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Forward config entry unload to entities."""
     hub = cast(Hub, entry.runtime_data)
 
+    if (handle := _reload_handles.pop(entry.entry_id, None)) is not None:
+        handle.cancel()
+
     hub.destroy()
 
     return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
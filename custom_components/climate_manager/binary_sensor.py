@@ -6,6 +6,7 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
 
+from .common import add_platform_entities
 from .hub import Hub
 
 
@@ -17,18 +18,4 @@ async def async_setup_entry(
     """Add sensors for passed config_entry in HA."""
     hub = cast(Hub, config_entry.runtime_data)
 
-    if hub.entity_bag.binary_sensors:
-        async_add_entities(hub.entity_bag.binary_sensors)
-    for zone in hub.zones.values():
-        if zone.entity_bag.binary_sensors:
-            async_add_entities(
-                zone.entity_bag.binary_sensors,
-                config_subentry_id=zone.config_subentry.subentry_id,
-            )
-
-    for circuit in hub.circuits.values():
-        if circuit.entity_bag.binary_sensors:
-            async_add_entities(
-                circuit.entity_bag.binary_sensors,
-                config_subentry_id=circuit.config_subentry.subentry_id,
-            )
+    add_platform_entities(hub, async_add_entities, "binary_sensors")
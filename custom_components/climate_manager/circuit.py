@@ -1,5 +1,6 @@
 """Heating circuit controller."""
 
+import asyncio
 import logging
 
 from homeassistant.components.climate import ClimateEntityFeature, HVACMode
@@ -26,7 +27,9 @@ class Circuit(ControllerBase):
         """Init heating circuit."""
         super().__init__(hass, circuit_config.title)
 
-        self.zones = zones
+        self.zones = tuple(zones)
+        # Pre-bound (zone, climate_entity) pairs for the per-tick control loop
+        self._zone_views = tuple((zone, zone.climate_entity) for zone in self.zones)
 
         # Device
         self.device_info = DeviceInfoModel(
@@ -36,76 +39,87 @@ class Circuit(ControllerBase):
         # Config
         self.config_subentry = circuit_config
 
-        config_data = circuit_config.data.copy()
-        self._switches = config_data.get(CONFIG_SWITCHES, [])
+        self._switches = circuit_config.data.get(CONFIG_SWITCHES) or []
 
         # Entities
-        self.circuit_active_sensor = self.entity_bag.add_binary_sensor(
-            CircuitActiveSensor(self.device_info)
+        self.circuit_active_sensor = self.entity_bag.add(
+            "binary_sensor", CircuitActiveSensor(self.device_info)
         )
-        self.climate = self.entity_bag.add_climate(CircuitClimate(self))
+        self.climate = self.entity_bag.add("climate", CircuitClimate(self))
 
     async def control_circuit(self) -> None:
         """Control the heating circuit."""
+        if not self.zones:
+            return
+
         cur_temp: float | None = None
-        target_temps: set[float] = set()
-        hvac_modes: set[HVACMode] = set()
-        preset_modes: set[str] = set()
+        target_temp: float | None = None
+        target_unanimous = True
+        hvac_mode: HVACMode | None = None
+        hvac_unanimous = True
+        preset_mode: str | None = None
+        preset_unanimous = True
         any_output = False
 
-        for zone in self.zones:
-            if zone.current_temperature:
-                cur_temp = (
-                    min(cur_temp, zone.current_temperature)
-                    if cur_temp
-                    else zone.current_temperature
-                )
-            if zone.climate_entity.target_temperature:
-                target_temps.add(zone.climate_entity.target_temperature)
-            if zone.climate_entity.hvac_mode:
-                hvac_modes.add(zone.climate_entity.hvac_mode)
-            if zone.climate_entity.preset_mode:
-                preset_modes.add(zone.climate_entity.preset_mode)
-            any_output = any_output or zone.regulator_output > 0
-
-        self.climate.set_current_temperature(cur_temp)
-        self.climate.set_target_temperature_no_notify(
-            target_temps.pop() if len(target_temps) == 1 else None
-        )
-        self.climate.set_hvac_mode_no_notify(
-            hvac_modes.pop() if len(hvac_modes) == 1 else None
-        )
-        self.climate.set_preset_mode_no_notify(
-            preset_modes.pop() if len(preset_modes) == 1 else None
+        for zone, ce in self._zone_views:
+            if cur := zone.current_temperature:
+                cur_temp = min(cur_temp, cur) if cur_temp else cur
+            if tt := ce.target_temperature:
+                if target_temp is None:
+                    target_temp = tt
+                elif tt != target_temp:
+                    target_unanimous = False
+            if hm := ce.hvac_mode:
+                if hvac_mode is None:
+                    hvac_mode = hm
+                elif hm != hvac_mode:
+                    hvac_unanimous = False
+            if pm := ce.preset_mode:
+                if preset_mode is None:
+                    preset_mode = pm
+                elif pm != preset_mode:
+                    preset_unanimous = False
+            if not any_output and zone.regulator_output > 0:
+                any_output = True
+
+        self.climate.update_from_zones(
+            cur_temp,
+            target_temp if target_unanimous else None,
+            hvac_mode if hvac_unanimous else None,
+            preset_mode if preset_unanimous else None,
         )
 
         await self.set_active(any_output)
 
     async def set_active(self, value: bool) -> None:
         """Set heating circuit as active."""
-        for sw in self._switches:
+        if self._switches:
+            # HA accepts a list target, so all switches toggle in one service call
             await self._hass.services.async_call(
                 "switch",  # domain
                 "turn_on" if value else "turn_off",  # service
-                {"entity_id": sw},
+                {"entity_id": self._switches},
             )
 
         self.circuit_active_sensor.set_is_on(value)
 
     async def handle_target_temperature_changed(self, value: float) -> None:
         """Handle target temperature being changed from UI."""
-        for zone in self.zones:
-            await zone.set_target_temperature_from_circuit(value)
+        await asyncio.gather(
+            *(zone.set_target_temperature_from_circuit(value) for zone in self.zones)
+        )
 
     async def handle_hvac_mode_changed(self, value: HVACMode) -> None:
         """Handle HVAC mode being changed from UI."""
-        for zone in self.zones:
-            await zone.set_hvac_mode_from_circuit(value)
+        await asyncio.gather(
+            *(zone.set_hvac_mode_from_circuit(value) for zone in self.zones)
+        )
 
     async def handle_preset_changed(self, value: str) -> None:
         """Handle preset being changed from UI."""
-        for zone in self.zones:
-            await zone.set_preset_from_circuit(value)
+        await asyncio.gather(
+            *(zone.set_preset_from_circuit(value) for zone in self.zones)
+        )
 
 
 class CircuitActiveSensor(
@@ -139,28 +153,24 @@ class CircuitClimate(ClimateBase):  # pylint: disable=hass-enforce-class-module
         super().__init__("Climate", circuit.device_info)
         self.circuit = circuit
 
-    def set_target_temperature_no_notify(self, value: float | None) -> None:
-        """Update the target temperature without triggering an update."""
-        self._attr_target_temperature = value
-        self.schedule_update_ha_state()
-
-    def set_target_temperature_high_no_notify(self, value: float | None) -> None:
-        """Update the high target temperature without triggering an update."""
-        self._attr_target_temperature_high = value
-        self.schedule_update_ha_state()
-
-    def set_target_temperature_low_no_notify(self, value: float | None) -> None:
-        """Update the low target temperature without triggering an update."""
-        self._attr_target_temperature_low = value
-        self.schedule_update_ha_state()
-
-    def set_hvac_mode_no_notify(self, hvac_mode: HVACMode | None) -> None:
-        """Update the HVAC mode without triggering an update."""
+    def update_from_zones(
+        self,
+        current_temperature: float | None,
+        target_temperature: float | None,
+        hvac_mode: HVACMode | None,
+        preset_mode: str | None,
+    ) -> None:
+        """Update all zone-aggregated attributes with a single state write."""
+        if (
+            current_temperature == self._attr_current_temperature
+            and target_temperature == self._attr_target_temperature
+            and hvac_mode == self._attr_hvac_mode
+            and preset_mode == self._attr_preset_mode
+        ):
+            return
+        self._attr_current_temperature = current_temperature
+        self._attr_target_temperature = target_temperature
         self._attr_hvac_mode = hvac_mode
-        self.schedule_update_ha_state()
-
-    def set_preset_mode_no_notify(self, preset_mode: str | None) -> None:
-        """Update the preset mode without triggering an update."""
         self._attr_preset_mode = preset_mode
         self.schedule_update_ha_state()
 
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import TypeVar
+from typing import Any, TypeVar
 
 from homeassistant.components.binary_sensor import BinarySensorEntity
 from homeassistant.components.climate import (
@@ -19,10 +19,38 @@ from homeassistant.const import UnitOfTemperature
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity import Entity
+from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
 from homeassistant.util import slugify
 
 from .const import DOMAIN
 
+_NAME_SLUG_CACHE: dict[str, str] = {}
+
+TEntity = TypeVar("TEntity", bound="HAEntityBase")
+
+
+def add_platform_entities(
+    hub: Any, async_add_entities: AddConfigEntryEntitiesCallback, bag_attr: str
+) -> None:
+    """Add hub, zone and circuit entities of a single platform to HA."""
+    entities = getattr(hub.entity_bag, bag_attr)
+    if entities:
+        async_add_entities(entities)
+
+    for zone in hub.zones.values():
+        entities = getattr(zone.entity_bag, bag_attr)
+        if entities:
+            async_add_entities(
+                entities, config_subentry_id=zone.config_subentry.subentry_id
+            )
+
+    for circuit in hub.circuits.values():
+        entities = getattr(circuit.entity_bag, bag_attr)
+        if entities:
+            async_add_entities(
+                entities, config_subentry_id=circuit.config_subentry.subentry_id
+            )
+
 
 class ControllerBase:
     """Base class for controllers, providing common initialization and an entity bag for managing entities."""
@@ -39,20 +67,24 @@ class ControllerBase:
 class DeviceInfoModel:
     """Model for storing device information and providing a DeviceInfo object."""
 
+    __slots__ = ("model", "identifier", "name", "name_slug", "_device_info")
+
     def __init__(self, name: str, identifier: str, model: str) -> None:
         """Intialize."""
         self.model = model
         self.identifier = identifier
         self.name = name
+        self.name_slug = slugify(name)
+        self._device_info = DeviceInfo(
+            name=name,
+            identifiers={(DOMAIN, identifier)},
+            manufacturer="Cats Ltd.",
+            model=model,
+        )
 
     def get_device_info(self) -> DeviceInfo:
         """Return the DeviceInfo object for the device."""
-        return DeviceInfo(
-            name=self.name,
-            identifiers={(DOMAIN, self.identifier)},
-            manufacturer="Cats Ltd.",
-            model=self.model,
-        )
+        return self._device_info
 
 
 class HAEntityBase(Entity):  # pylint: disable=hass-enforce-class-module
@@ -64,13 +96,13 @@ class HAEntityBase(Entity):  # pylint: disable=hass-enforce-class-module
     def __init__(self, name: str, device_info: DeviceInfoModel) -> None:
         """Intialize."""
         self._attr_name = name
-        self._attr_unique_id = f"{DOMAIN}_{slugify(f'{device_info.name} {name}')}"
-        self._device_info = device_info
-
-    @property
-    def device_info(self) -> DeviceInfo | None:
-        """Return the device information."""
-        return self._device_info.get_device_info()
+        # Entity names are a handful of shared constants, so cache their slugs
+        name_slug = _NAME_SLUG_CACHE.get(name)
+        if name_slug is None:
+            name_slug = _NAME_SLUG_CACHE[name] = slugify(name)
+        self._attr_unique_id = f"{DOMAIN}_{device_info.name_slug}_{name_slug}"
+        # All entities of a device share the model's single DeviceInfo mapping
+        self._attr_device_info = device_info.get_device_info()
 
 
 class SensorBase(HAEntityBase, SensorEntity):  # pylint: disable=hass-enforce-class-module
@@ -80,6 +112,8 @@ class SensorBase(HAEntityBase, SensorEntity):  # pylint: disable=hass-enforce-cl
 
     def set_native_value(self, value: float) -> None:
         """Update the native value of the sensor."""
+        if value == self._attr_native_value:
+            return
         self._attr_native_value = value
         self.schedule_update_ha_state()
 
@@ -91,6 +125,8 @@ class BinarySensorBase(HAEntityBase, BinarySensorEntity):  # pylint: disable=has
 
     def set_is_on(self, value: bool) -> None:
         """Update the on/off state of the binary sensor."""
+        if value == self._attr_is_on:
+            return
         self._attr_is_on = value
         self.schedule_update_ha_state()
 
@@ -106,6 +142,8 @@ class NumberBase(HAEntityBase, RestoreNumber):  # pylint: disable=hass-enforce-c
 
     def set_native_value(self, value: float) -> None:
         """Update the current value of the number entity."""
+        if value == self._attr_native_value:
+            return
         self._attr_native_value = value
         self.schedule_update_ha_state()
 
@@ -119,16 +157,21 @@ class ClimateBase(HAEntityBase, ClimateEntity):  # pylint: disable=hass-enforce-
         | ClimateEntityFeature.TURN_ON
         | ClimateEntityFeature.TURN_OFF
     )
-    _attr_hvac_modes = [HVACMode.OFF, HVACMode.HEAT]
+    _attr_hvac_modes = (HVACMode.OFF, HVACMode.HEAT)
     _attr_hvac_mode = HVACMode.HEAT
-    _attr_preset_modes = [PRESET_HOME, PRESET_SLEEP, PRESET_AWAY]
+    _attr_preset_modes = (PRESET_HOME, PRESET_SLEEP, PRESET_AWAY)
     _attr_preset_mode = PRESET_HOME
+    # Frozen views for O(1) membership checks when restoring state
+    _hvac_modes_set = frozenset(_attr_hvac_modes)
+    _preset_modes_set = frozenset(_attr_preset_modes)
     _attr_precision = 0.1
     _attr_target_temperature_step = 0.5
     _attr_temperature_unit = UnitOfTemperature.CELSIUS
 
     def set_current_temperature(self, value: float) -> None:
         """Update the current temperature of the climate entity."""
+        if value == self._attr_current_temperature:
+            return
         self._attr_current_temperature = value
         self.schedule_update_ha_state()
 
@@ -136,34 +179,38 @@ class ClimateBase(HAEntityBase, ClimateEntity):  # pylint: disable=hass-enforce-
 class EntityBag:
     """Container for managing lists of entities of different types."""
 
+    __slots__ = ("_lists",)
+
     def __init__(self) -> None:
         """Intialize."""
-        self.binary_sensors: list[Entity] = []
-        self.sensors: list[Entity] = []
-        self.climates: list[Entity] = []
-        self.numbers: list[Entity] = []
-
-    TBinarySensorEntity = TypeVar("TBinarySensorEntity", bound=BinarySensorBase)
-    TSensorEntity = TypeVar("TSensorEntity", bound=SensorBase)
-    TClimateEntity = TypeVar("TClimateEntity", bound=ClimateBase)
-    TNumberEntity = TypeVar("TNumberEntity", bound=NumberBase)
-
-    def add_binary_sensor(self, sensor: TBinarySensorEntity) -> TBinarySensorEntity:
-        """Add a binary sensor to the list."""
-        self.binary_sensors.append(sensor)
-        return sensor
-
-    def add_sensor(self, sensor: TSensorEntity) -> TSensorEntity:
-        """Add a sensor to the list."""
-        self.sensors.append(sensor)
-        return sensor
-
-    def add_climate(self, climate: TClimateEntity) -> TClimateEntity:
-        """Add a climate entity to the list."""
-        self.climates.append(climate)
-        return climate
-
-    def add_number(self, number: TNumberEntity) -> TNumberEntity:
-        """Add a number entity to the list."""
-        self.numbers.append(number)
-        return number
+        self._lists: dict[str, list[Entity]] = {
+            "binary_sensor": [],
+            "sensor": [],
+            "climate": [],
+            "number": [],
+        }
+
+    def add(self, kind: str, entity: TEntity) -> TEntity:
+        """Add an entity to the list for the given platform kind."""
+        self._lists[kind].append(entity)
+        return entity
+
+    @property
+    def binary_sensors(self) -> list[Entity]:
+        """Get the list of binary sensor entities."""
+        return self._lists["binary_sensor"]
+
+    @property
+    def sensors(self) -> list[Entity]:
+        """Get the list of sensor entities."""
+        return self._lists["sensor"]
+
+    @property
+    def climates(self) -> list[Entity]:
+        """Get the list of climate entities."""
+        return self._lists["climate"]
+
+    @property
+    def numbers(self) -> list[Entity]:
+        """Get the list of number entities."""
+        return self._lists["number"]
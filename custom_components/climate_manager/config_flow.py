@@ -1,6 +1,5 @@
 """Config flow for CLimate Manager."""
 
-import logging
 from typing import Any
 
 import voluptuous as vol
@@ -38,7 +37,67 @@ from .const import (
     SUBENTRY_TYPE_ZONE,
 )
 
-_LOGGER = logging.getLogger(__name__)
+# Selector configs are constant, so build them once at import instead of on
+# every form render.
+_BOILER_SENSOR_SELECTOR = selector({"entity": {"filter": {"domain": "binary_sensor"}}})
+_REGULATOR_TYPE_SELECTOR = selector(
+    {"select": {"options": [REGULATOR_TYPE_PID, REGULATOR_TYPE_HYSTERESIS]}}
+)
+_TEMPERATURE_SENSOR_SELECTOR = selector(
+    {
+        "entity": {
+            "filter": {
+                "domain": "sensor",
+                "device_class": "temperature",
+            }
+        }
+    }
+)
+_WINDOW_SENSORS_SELECTOR = selector(
+    {
+        "entity": {
+            "filter": {
+                "domain": "binary_sensor",
+                # "device_class": "door",
+            },
+            "multiple": True,
+        }
+    }
+)
+_TRVS_SELECTOR = selector(
+    {
+        "entity": {
+            "filter": {"domain": "climate"},
+            "multiple": True,
+        }
+    }
+)
+_ZONES_SELECTOR = selector(
+    {
+        "device": {
+            "filter": {
+                "integration": DOMAIN,
+                "model": "Zone Thermostat",
+            },
+            "multiple": True,
+        }
+    }
+)
+_SWITCHES_SELECTOR = selector(
+    {
+        "entity": {
+            "filter": {"domain": "switch"},
+            "multiple": True,
+        }
+    }
+)
+
+# Fully static schemas (no dynamic defaults) compiled once at import
+_HUB_NAME_SCHEMA = vol.Schema(
+    {vol.Required(CONFIG_MAIN_THERMOSTAT_NAME, default="Main Thermostat"): str}
+)
+_ZONE_NAME_SCHEMA = vol.Schema({vol.Required(CONFIG_ZONE_NAME): str})
+_CIRCUIT_NAME_SCHEMA = vol.Schema({vol.Required("circuit_name"): str})
 
 
 class HubConfigFlow(ConfigFlow, domain=DOMAIN):
@@ -55,9 +114,7 @@ class HubConfigFlow(ConfigFlow, domain=DOMAIN):
         self, user_input: dict[str, Any] | None = None
     ) -> ConfigFlowResult:
         """First step in user-initiated flow."""
-        data_schema = vol.Schema(
-            {vol.Required(CONFIG_MAIN_THERMOSTAT_NAME, default="Main Thermostat"): str}
-        )
+        data_schema = _HUB_NAME_SCHEMA
 
         if user_input is not None:
             self._input_data = user_input
@@ -81,22 +138,14 @@ class HubConfigFlow(ConfigFlow, domain=DOMAIN):
         """Configure boiler online sensor."""
         existing = {}
         if self.source == SOURCE_RECONFIGURE:
-            existing = self._get_reconfigure_entry().data.copy()
+            existing = self._get_reconfigure_entry().data
 
         data_schema = vol.Schema(
             {
                 vol.Optional(
                     CONFIG_BOILER_STATUS_SENSOR,
                     default=existing.get(CONFIG_BOILER_STATUS_SENSOR),
-                ): selector(
-                    {
-                        "entity": {
-                            "filter": {
-                                "domain": "binary_sensor",
-                            }
-                        }
-                    }
-                ),
+                ): _BOILER_SENSOR_SELECTOR,
             }
         )
 
@@ -141,22 +190,13 @@ class ZoneSubentryFlowHandler(ConfigSubentryFlow):
     ) -> SubentryFlowResult:
         """User flow to add a new heating zone."""
 
-        data_schema = vol.Schema({vol.Required(CONFIG_ZONE_NAME): str})
-
-        errors: dict[str, str] = {}
+        data_schema = _ZONE_NAME_SCHEMA
 
         if user_input is not None:
             # The form has been filled in and submitted, so process the data provided.
-            try:
-                pass
-            except Exception:  # pylint: disable=broad-except
-                _LOGGER.exception("Unexpected exception")
-                errors["base"] = "unknown"
-
-            if "base" not in errors:
-                self._input_data = user_input
-                self._title = user_input.get(CONFIG_ZONE_NAME)
-                return await self.async_step_entities()
+            self._input_data = user_input
+            self._title = user_input.get(CONFIG_ZONE_NAME)
+            return await self.async_step_entities()
 
         return self.async_show_form(step_id=STEP_USER, data_schema=data_schema)
 
@@ -168,81 +208,40 @@ class ZoneSubentryFlowHandler(ConfigSubentryFlow):
         # Try to load existing values
         existing = {}
         if self.source == SOURCE_RECONFIGURE:
-            existing = self._get_reconfigure_subentry().data.copy()
+            existing = self._get_reconfigure_subentry().data
 
         data_schema = vol.Schema(
             {
                 vol.Required(
                     CONFIG_REGULATOR_TYPE,
                     default=existing.get(CONFIG_REGULATOR_TYPE, REGULATOR_TYPE_PID),
-                ): selector(
-                    {
-                        "select": {
-                            "options": [REGULATOR_TYPE_PID, REGULATOR_TYPE_HYSTERESIS]
-                        }
-                    }
-                ),
+                ): _REGULATOR_TYPE_SELECTOR,
                 vol.Required(
                     CONFIG_TEMPERATURE_SENSOR,
                     default=existing.get(CONFIG_TEMPERATURE_SENSOR),
-                ): selector(
-                    {
-                        "entity": {
-                            "filter": {
-                                "domain": "sensor",
-                                "device_class": "temperature",
-                            }
-                        }
-                    }
-                ),
+                ): _TEMPERATURE_SENSOR_SELECTOR,
                 vol.Optional(
                     CONFIG_WINDOW_SENSORS,
                     default=existing.get(CONFIG_WINDOW_SENSORS, []),
-                ): selector(
-                    {
-                        "entity": {
-                            "filter": {
-                                "domain": "binary_sensor",
-                                # "device_class": "door",
-                            },
-                            "multiple": True,
-                        }
-                    }
-                ),
+                ): _WINDOW_SENSORS_SELECTOR,
                 vol.Optional(
                     CONFIG_TRVS, default=existing.get(CONFIG_TRVS, [])
-                ): selector(
-                    {
-                        "entity": {
-                            "filter": {"domain": "climate"},
-                            "multiple": True,
-                        }
-                    }
-                ),
+                ): _TRVS_SELECTOR,
             }
         )
 
-        errors: dict[str, str] = {}
-
         if user_input is not None:
             # The form has been filled in and submitted, so process the data provided.
-            try:
-                pass
-            except Exception:  # pylint: disable=broad-except
-                _LOGGER.exception("Unexpected exception")
-                errors["base"] = "unknown"
-
-            if "base" not in errors:
-                self._input_data = user_input
+            self._input_data = user_input
 
-                if self.source == SOURCE_RECONFIGURE:
-                    return self.async_update_and_abort(
-                        self._get_entry(),
-                        self._get_reconfigure_subentry(),
-                        data_updates=self._input_data,
-                    )
+            if self.source == SOURCE_RECONFIGURE:
+                return self.async_update_and_abort(
+                    self._get_entry(),
+                    self._get_reconfigure_subentry(),
+                    data_updates=self._input_data,
+                )
 
-                return self.async_create_entry(title=self._title, data=self._input_data)
+            return self.async_create_entry(title=self._title, data=self._input_data)
 
         return self.async_show_form(step_id=STEP_ENTITIES, data_schema=data_schema)
 
@@ -265,22 +264,13 @@ class CircuitSubentryFlowHandler(ConfigSubentryFlow):
     ) -> SubentryFlowResult:
         """User flow to add a new heating circuit."""
 
-        data_schema = vol.Schema({vol.Required("circuit_name"): str})
-
-        errors: dict[str, str] = {}
+        data_schema = _CIRCUIT_NAME_SCHEMA
 
         if user_input is not None:
             # The form has been filled in and submitted, so process the data provided.
-            try:
-                pass
-            except Exception:  # pylint: disable=broad-except
-                _LOGGER.exception("Unexpected exception")
-                errors["base"] = "unknown"
-
-            if "base" not in errors:
-                self._input_data = user_input
-                self._title = user_input.get("circuit_name")
-                return await self.async_step_entities()
+            self._input_data = user_input
+            self._title = user_input.get("circuit_name")
+            return await self.async_step_entities()
 
         return self.async_show_form(step_id=STEP_USER, data_schema=data_schema)
 
@@ -292,57 +282,31 @@ class CircuitSubentryFlowHandler(ConfigSubentryFlow):
         # Try to load existing values
         existing = {}
         if self.source == SOURCE_RECONFIGURE:
-            existing = self._get_reconfigure_subentry().data.copy()
+            existing = self._get_reconfigure_subentry().data
 
         data_schema = vol.Schema(
             {
                 vol.Required(
                     CONFIG_ZONES, default=existing.get(CONFIG_ZONES, [])
-                ): selector(
-                    {
-                        "device": {
-                            "filter": {
-                                "integration": DOMAIN,
-                                "model": "Zone Thermostat",
-                            },
-                            "multiple": True,
-                        }
-                    }
-                ),
+                ): _ZONES_SELECTOR,
                 vol.Optional(
                     CONFIG_SWITCHES, default=existing.get(CONFIG_SWITCHES, [])
-                ): selector(
-                    {
-                        "entity": {
-                            "filter": {"domain": "switch"},
-                            "multiple": True,
-                        }
-                    }
-                ),
+                ): _SWITCHES_SELECTOR,
             }
         )
 
-        errors: dict[str, str] = {}
-
         if user_input is not None:
             # The form has been filled in and submitted, so process the data provided.
-            try:
-                pass
-            except Exception:  # pylint: disable=broad-except
-                _LOGGER.exception("Unexpected exception")
-                errors["base"] = "unknown"
-
-            if "base" not in errors:
-                self._input_data = user_input
-
-                if self.source == SOURCE_RECONFIGURE:
-                    return self.async_update_and_abort(
-                        self._get_entry(),
-                        self._get_reconfigure_subentry(),
-                        data_updates=self._input_data,
-                    )
-
-                return self.async_create_entry(title=self._title, data=self._input_data)
+            self._input_data = user_input
+
+            if self.source == SOURCE_RECONFIGURE:
+                return self.async_update_and_abort(
+                    self._get_entry(),
+                    self._get_reconfigure_subentry(),
+                    data_updates=self._input_data,
+                )
+
+            return self.async_create_entry(title=self._title, data=self._input_data)
 
         return self.async_show_form(step_id=STEP_ENTITIES, data_schema=data_schema)
 
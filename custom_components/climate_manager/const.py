@@ -1,28 +1,30 @@
 """Climate manager."""
 
-DOMAIN = "climate_manager"
-ENTITY_ID_FORMAT = DOMAIN + ".{}"
+from typing import Final
 
-CONFIG_MAIN_THERMOSTAT_NAME = "main_thermostat_name"
-CONFIG_ZONE_NAME = "zone_name"
-CONFIG_REGULATOR_TYPE = "regulator_type"
-CONFIG_TEMPERATURE_SENSOR = "temperature_sensor"
-CONFIG_WINDOW_SENSORS = "window_sensors"
-CONFIG_TRVS = "trvs"
-CONFIG_BOILER_STATUS_SENSOR = "boiler_status_sensor"
-CONFIG_ZONES = "zones"
-CONFIG_SWITCHES = "switches"
+DOMAIN: Final = "climate_manager"
+ENTITY_ID_FORMAT: Final = DOMAIN + ".{}"
 
-REGULATOR_TYPE_PID = "PID"
-REGULATOR_TYPE_HYSTERESIS = "Hysteresis"
+CONFIG_MAIN_THERMOSTAT_NAME: Final = "main_thermostat_name"
+CONFIG_ZONE_NAME: Final = "zone_name"
+CONFIG_REGULATOR_TYPE: Final = "regulator_type"
+CONFIG_TEMPERATURE_SENSOR: Final = "temperature_sensor"
+CONFIG_WINDOW_SENSORS: Final = "window_sensors"
+CONFIG_TRVS: Final = "trvs"
+CONFIG_BOILER_STATUS_SENSOR: Final = "boiler_status_sensor"
+CONFIG_ZONES: Final = "zones"
+CONFIG_SWITCHES: Final = "switches"
 
-SUBENTRY_TYPE_ZONE = "zone"
-SUBENTRY_TYPE_CIRCUIT = "circuit"
+REGULATOR_TYPE_PID: Final = "PID"
+REGULATOR_TYPE_HYSTERESIS: Final = "Hysteresis"
 
-STEP_USER = "user"
-STEP_MENU = "menu"
-STEP_ENTITIES = "entities"
-STEP_BOILER = "boiler"
-STEP_ZONES = "heating_zones"
-STEP_CIRCUITS = "heating_circuits"
-STEP_FINISH = "finish"
+SUBENTRY_TYPE_ZONE: Final = "zone"
+SUBENTRY_TYPE_CIRCUIT: Final = "circuit"
+
+STEP_USER: Final = "user"
+STEP_MENU: Final = "menu"
+STEP_ENTITIES: Final = "entities"
+STEP_BOILER: Final = "boiler"
+STEP_ZONES: Final = "heating_zones"
+STEP_CIRCUITS: Final = "heating_circuits"
+STEP_FINISH: Final = "finish"
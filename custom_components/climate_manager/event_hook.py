@@ -4,21 +4,34 @@
 class EventHook:
     """Manages event handlers for triggering actions."""
 
+    __slots__ = ("_EventHook__handlers",)
+
     def __init__(self) -> None:
-        """Initialize an empty list to store event handlers."""
-        self.__handlers = []
+        """Initialize an empty tuple to store event handlers."""
+        self.__handlers = ()
 
     def __iadd__(self, handler):
-        """Add a handler to the list of event handlers."""
-        self.__handlers.append(handler)
+        """Add a handler to the tuple of event handlers."""
+        self.__handlers = self.__handlers + (handler,)
         return self
 
     def __isub__(self, handler):
-        """Remove a handler from the list of event handlers."""
-        self.__handlers.remove(handler)
+        """Remove a handler from the tuple of event handlers."""
+        self.__handlers = tuple(h for h in self.__handlers if h is not handler)
         return self
 
+    def __bool__(self) -> bool:
+        """Return whether any handlers are registered."""
+        return bool(self.__handlers)
+
     def __call__(self, *args, **kwargs):
         """Trigger all registered handlers with the provided arguments."""
-        for handler in self.__handlers:
+        handlers = self.__handlers
+        for handler in handlers:
             handler(*args, **kwargs)
+
+    def fire(self):
+        """Trigger all registered handlers without argument unpacking overhead."""
+        handlers = self.__handlers
+        for handler in handlers:
+            handler()
@@ -1,20 +1,26 @@
 """Hub."""
 
+import asyncio
 from datetime import datetime, timedelta
+from functools import partial
 import logging
+from types import MappingProxyType
 
 from homeassistant.components.binary_sensor import BinarySensorDeviceClass
 from homeassistant.config_entries import ConfigEntry, ConfigSubentry
 from homeassistant.const import EntityCategory
-from homeassistant.core import HomeAssistant
+from homeassistant.core import Event, HomeAssistant, callback
 from homeassistant.helpers import device_registry as dr
-from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.event import (
+    async_track_state_change_event,
+    async_track_time_interval,
+)
 
 from .circuit import Circuit
 from .common import BinarySensorBase, ControllerBase, DeviceInfoModel, SensorBase
 from .const import CONFIG_BOILER_STATUS_SENSOR, CONFIG_ZONES
 from .online_tracker import OnlineTracker
-from .utils import get_state_bool
+from .utils import get_state_bool, str_to_bool
 from .zone import Zone
 
 _LOGGER = logging.getLogger(__name__)
@@ -43,56 +49,83 @@ class Hub(ControllerBase):
         self.boiler_online_sensor: str | None = config_data.get(
             CONFIG_BOILER_STATUS_SENSOR
         )
-        self.zones = {
+        self._zones = {
             zone_config.subentry_id: Zone(hass, zone_config)
             for zone_config in zones_config
         }
         # self.zone_circuit_id_map: dict[str, str] = {}
 
-        circuit_zone_map: dict[str, list[str]] = {}
-
+        # Resolve each referenced device to its subentry once, so circuits
+        # sharing zones do an O(1) lookup instead of walking the registry again
         device_registry = dr.async_get(hass)
+        device_to_subentry: dict[str, str] = {}
         for circuit_config in circuits_config:
-            devices = circuit_config.data[CONFIG_ZONES]
-            circuit_zone_map[circuit_config.subentry_id] = []
-            for device in devices:
-                device = device_registry.async_get(device)
+            for device_id in circuit_config.data[CONFIG_ZONES]:
+                if device_id in device_to_subentry:
+                    continue
+                device = device_registry.async_get(device_id)
                 # Maybe zone was deleted but is still referenced in circuit
                 if not device:
                     continue
-                subentry_id = next(
+                device_to_subentry[device_id] = next(
                     iter(next(iter(device.config_entries_subentries.values())))
                 )
-                circuit_zone_map[circuit_config.subentry_id].append(subentry_id)
 
-        self.circuits = {
+        self._circuits = {
             circuit_config.subentry_id: Circuit(
                 hass,
                 circuit_config,
                 [
-                    self.zones[zone_id]
-                    for zone_id in circuit_zone_map[circuit_config.subentry_id]
+                    self._zones[device_to_subentry[device_id]]
+                    for device_id in circuit_config.data[CONFIG_ZONES]
+                    if device_id in device_to_subentry
                 ],
             )
             for circuit_config in circuits_config
         }
 
         # Entities
-        self.output_entity = self.entity_bag.add_sensor(HubOutput(self.device_info))
-        self.control_fault_entity = self.entity_bag.add_binary_sensor(
-            HubControlFaultSensor(self.device_info)
+        self.output_entity = self.entity_bag.add("sensor", HubOutput(self.device_info))
+        self.control_fault_entity = self.entity_bag.add(
+            "binary_sensor", HubControlFaultSensor(self.device_info)
         )
         self.boiler_fault_entity = (
-            self.entity_bag.add_binary_sensor(HubBoilerFaultSensor(self.device_info))
+            self.entity_bag.add("binary_sensor", HubBoilerFaultSensor(self.device_info))
             if self.boiler_online_sensor
             else None
         )
-        self.aggregate_fault_entity = self.entity_bag.add_binary_sensor(
-            HubAggregateFaultSensor(self.device_info)
+        self.aggregate_fault_entity = self.entity_bag.add(
+            "binary_sensor", HubAggregateFaultSensor(self.device_info)
+        )
+
+        # Cached sequences for the 1Hz control loop; dict views would be
+        # rebuilt on every tick
+        # Read-only views for platforms; mutation stays inside the hub so the
+        # cached tuples below cannot drift out of sync
+        self.zones = MappingProxyType(self._zones)
+        self.circuits = MappingProxyType(self._circuits)
+
+        self._zones_seq = tuple(self._zones.values())
+        self._circuits_seq = tuple(self._circuits.values())
+        # Bound methods resolved once instead of per zone/circuit per tick
+        self._zone_control_fns = tuple(
+            zone.control_temperature for zone in self._zones_seq
+        )
+        self._circuit_control_fns = tuple(
+            circuit.control_circuit for circuit in self._circuits_seq
         )
 
+        # Running max of zone outputs, updated from zone change events instead
+        # of rescanning every zone each tick
+        self._zone_outputs = [0.0] * len(self._zones_seq)
+        self._max_output = 0.0
+        for index, zone in enumerate(self._zones_seq):
+            zone.on_output_changed += partial(self._handle_zone_output_changed, index)
+
         # Private
         self._unsubscribe = None
+        self._unsubscribe_boiler = None
+        self._boiler_online_cached = False
         self._boiler_online_tracker = OnlineTracker(
             self.boiler_fault_entity,
             timedelta(seconds=20),
@@ -100,11 +133,22 @@ class Hub(ControllerBase):
             self._open_trvs_start_pumps,
         )
 
-    def initialize(self):
+    async def async_initialize(self):
         """Initialize the hub components."""
-        for zone in self.zones.values():
+        for zone in self._zones_seq:
             zone.initialize()
 
+        # Track the boiler sensor instead of polling it every tick
+        if self.boiler_online_sensor:
+            self._boiler_online_cached = get_state_bool(
+                self._hass, self.boiler_online_sensor, default=False
+            )
+            self._unsubscribe_boiler = async_track_state_change_event(
+                self._hass,
+                [self.boiler_online_sensor],
+                self._handle_boiler_state_changed,
+            )
+
         self._unsubscribe = async_track_time_interval(
             self._hass, self._async_control_heating, timedelta(seconds=1)
         )
@@ -113,32 +157,55 @@ class Hub(ControllerBase):
         """Destroy the hub and clean up resources."""
         if self._unsubscribe:
             self._unsubscribe()
+        if self._unsubscribe_boiler:
+            self._unsubscribe_boiler()
+
+    def _handle_zone_output_changed(self, index: int, output: float) -> None:
+        """Maintain the cached max when a zone's output changes."""
+        outputs = self._zone_outputs
+        old = outputs[index]
+        outputs[index] = output
+        if output >= self._max_output:
+            self._max_output = output
+        elif old == self._max_output:
+            # The previous max decreased, rescan to find the new one
+            self._max_output = max(outputs)
+
+    @callback
+    def _handle_boiler_state_changed(self, event: Event) -> None:
+        """Cache the boiler online flag when the sensor state changes."""
+        # The new state rides on the event, no need to query the state machine
+        state = event.data["new_state"]
+        self._boiler_online_cached = bool(state and str_to_bool(state.state))
 
     async def _async_control_heating(self, _now: datetime) -> None:
         """Control the heating system based on current conditions."""
         # If sensor is not set, we assume the boiler is online
         if self.boiler_online_sensor:
-            boiler_online = get_state_bool(
-                self._hass, self.boiler_online_sensor, default=False
-            )
-            if not await self._boiler_online_tracker.is_online(boiler_online):
+            if not await self._boiler_online_tracker.is_online(
+                self._boiler_online_cached
+            ):
+                return
+            # The boiler signal is flapping; skip regulator work until it
+            # either comes back or the tracker reports it offline
+            if self._boiler_online_tracker.is_awaiting:
                 return
 
         try:
-            output = 0.0
-
-            for zone in self.zones.values():
-                await zone.control_temperature()
-                output = max(output, zone.regulator_output)
+            # Zones are independent, so run them concurrently; each zone
+            # handles its own control faults internally
+            if self._zone_control_fns:
+                await asyncio.gather(*(fn() for fn in self._zone_control_fns))
 
-            for circuit in self.circuits.values():
-                await circuit.control_circuit()
+            if self._circuit_control_fns:
+                await asyncio.gather(*(fn() for fn in self._circuit_control_fns))
 
-            self.output_entity.set_native_value(output)
+            self.output_entity.set_native_value(self._max_output)
 
             # If we reached here, we recovered from a previous unexpected fault. Clear the fault sensor and log
             if self.control_fault_entity.is_on:
-                _LOGGER.info("Hub %s recovered from unexpected fault", self._name)
+                if _LOGGER.isEnabledFor(logging.INFO):
+                    _LOGGER.info("Hub %s recovered from unexpected fault", self._name)
                 self.control_fault_entity.set_is_on(False)
         except Exception:
             # Function is called every second, and we don't want to spam the logs
@@ -153,17 +220,18 @@ class Hub(ControllerBase):
 
     async def _open_trvs_start_pumps(self):
         """Start pumps and open TRVs to circulate heating."""
-        _LOGGER.info("Starting pumps and opening TRVs")
-        for zone in self.zones.values():
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info("Starting pumps and opening TRVs")
+        for zone in self._zones_seq:
             await zone.operate_trvs(1)
-        for circuit in self.circuits.values():
+        for circuit in self._circuits_seq:
             await circuit.set_active(True)
 
     def _has_aggregate_fault(self) -> bool:
         if self.control_fault_entity.is_on or self.boiler_fault_entity.is_on:
             return True
 
-        for zone in self.zones.values():
+        for zone in self._zones_seq:
             if zone.sensor_fault_entity.is_on or zone.control_fault_entity.is_on:
                 return True
 
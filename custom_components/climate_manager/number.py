@@ -6,6 +6,7 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
 
+from .common import add_platform_entities
 from .hub import Hub
 
 
@@ -17,8 +18,4 @@ async def async_setup_entry(
     """Add sensors for passed config_entry in HA."""
     hub = cast(Hub, config_entry.runtime_data)
 
-    for zone in hub.zones.values():
-        async_add_entities(
-            zone.entity_bag.numbers,
-            config_subentry_id=zone.config_subentry.subentry_id,
-        )
+    add_platform_entities(hub, async_add_entities, "numbers")
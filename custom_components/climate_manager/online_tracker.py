@@ -1,8 +1,8 @@
 """Online tracker."""
 
-import asyncio
 from collections.abc import Awaitable, Callable
 from datetime import timedelta
+import inspect
 import logging
 
 from .common import BinarySensorBase
@@ -14,6 +14,15 @@ _LOGGER = logging.getLogger(__name__)
 class OnlineTracker:
     """Track the online status of a sensor and handle offline events."""
 
+    __slots__ = (
+        "_wait_interval",
+        "_fault_entity",
+        "_sensor_name",
+        "_became_offline_callback",
+        "_offline_callback_is_async",
+        "_awaiter",
+    )
+
     def __init__(
         self,
         fault_entity: BinarySensorBase,
@@ -26,48 +35,77 @@ class OnlineTracker:
         self._fault_entity = fault_entity
         self._sensor_name = sensor_name
         self._became_offline_callback = became_offline_callback
+        # Classify the callback once instead of type-checking its result on
+        # every offline transition
+        self._offline_callback_is_async = inspect.iscoroutinefunction(
+            became_offline_callback
+        )
         self._awaiter: SimpleAwaiter | None = None
 
+    @property
+    def is_awaiting(self) -> bool:
+        """Get whether the tracker is waiting for the sensor to come back."""
+        return self._awaiter is not None
+
     async def is_online(self, online_raw: bool) -> bool:
         """Determine if the sensor is online, considering fault states and wait intervals."""
+        # Steady state: sensor is online and nothing to recover from
+        if online_raw and not self._fault_entity.is_on and self._awaiter is None:
+            return True
+
         if not online_raw:
-            if self._fault_entity.is_on:
-                # Fault is already set, wait for sensor to become online and do nothing
-                return False
-            if not self._awaiter:
-                # This is a new development. Try to wait for _wait_interval for sensor to come online
+            return await self._handle_offline()
+
+        self._handle_recovery()
+
+        return True  # Definitely online
+
+    async def _handle_offline(self) -> bool:
+        """Handle a tick where the sensor is reported offline."""
+        if self._fault_entity.is_on:
+            # Fault is already set, wait for sensor to become online and do nothing
+            return False
+        if not self._awaiter:
+            # This is a new development. Try to wait for _wait_interval for sensor to come online
+            if _LOGGER.isEnabledFor(logging.INFO):
                 _LOGGER.info(
                     "%s became offline, waiting for %s to resolve itself",
                     self._sensor_name,
                     self._wait_interval,
                 )
-                self._awaiter = SimpleAwaiter(self._wait_interval)
+            self._awaiter = SimpleAwaiter(self._wait_interval)
 
-                return True  # We are still assuming sensor is OK, just temporarily disconnected
+            return True  # We are still assuming sensor is OK, just temporarily disconnected
 
-            if self._awaiter.elapsed:
-                # Sensor didn't come back in _wait_interval, let's report it offline and fire a callback
-                self._awaiter = None
+        if self._awaiter.elapsed:
+            # Sensor didn't come back in _wait_interval, let's report it offline and fire a callback
+            self._awaiter = None
+            if _LOGGER.isEnabledFor(logging.WARNING):
                 _LOGGER.warning(
                     "%s didn't come back in %s",
                     self._sensor_name,
                     self._wait_interval,
                 )
-                if self._became_offline_callback:
-                    cr = self._became_offline_callback()
-                    if asyncio.iscoroutine(cr):
-                        await cr
+            if self._became_offline_callback:
+                result = self._became_offline_callback()
+                if self._offline_callback_is_async:
+                    await result
 
-                self._fault_entity.set_is_on(True)
+            self._fault_entity.set_is_on(True)
 
-                return False  # Nope, its offline
+            return False  # Nope, its offline
 
-            return True  # Still giving it a chance while awaiter has not elapsed
+        return True  # Still giving it a chance while awaiter has not elapsed
 
+    def _handle_recovery(self) -> None:
+        """Handle the sensor coming back online after a fault or a wait."""
         if self._fault_entity.is_on:
-            _LOGGER.info("%s has come back after the fault state", self._sensor_name)
+            if _LOGGER.isEnabledFor(logging.INFO):
+                _LOGGER.info(
+                    "%s has come back after the fault state", self._sensor_name
+                )
             self._fault_entity.set_is_on(False)
-        if self._awaiter is not None:
+        if self._awaiter is not None and _LOGGER.isEnabledFor(logging.INFO):
             _LOGGER.info(
                 "%s has come back in less than %s",
                 self._sensor_name,
@@ -75,5 +113,3 @@ class OnlineTracker:
             )
 
         self._awaiter = None
-
-        return True  # Definitely online
@@ -1,5 +1,7 @@
 """Regulators."""
 
+from collections import deque
+
 from simple_pid import PID
 
 from homeassistant.components.number import NumberMode
@@ -8,10 +10,17 @@ from homeassistant.const import EntityCategory
 from .common import DeviceInfoModel, EntityBag, NumberBase, SensorBase
 from .event_hook import EventHook
 
+# PID construction constants, hoisted so re-initialization reuses them
+_PID_OUTPUT_LIMITS = (-1.0, 1.0)
+_PID_SAMPLE_TIME = 1
+_DEFAULT_AVERAGE_SAMPLES = 20
+
 
 class RegulatorBase:
     """Base class for temperature regulators."""
 
+    __slots__ = ()
+
     def initialize(self, target_temperature: float) -> None:
         """Initialize the regulator with the target temperature."""
         raise NotImplementedError
@@ -59,23 +68,26 @@ class PidRegulator(RegulatorBase):
         self,
         entity_bag: EntityBag,
         device_info: DeviceInfoModel,
-        average_samples: int = 20,
+        average_samples: int = _DEFAULT_AVERAGE_SAMPLES,
     ) -> None:
         """Init PID regulator."""
         # Events
         self.on_coeffs_changed = EventHook()
 
         # Entities
-        self.kp_entity = entity_bag.add_number(PidKpNumber(self, device_info))
-        self.ki_entity = entity_bag.add_number(PidKiNumber(self, device_info))
-        self.proportional_entity = entity_bag.add_sensor(
-            PidProportionalSensor(device_info)
+        self.kp_entity = entity_bag.add("number", PidKpNumber(self, device_info))
+        self.ki_entity = entity_bag.add("number", PidKiNumber(self, device_info))
+        self.proportional_entity = entity_bag.add(
+            "sensor", PidProportionalSensor(device_info)
         )
-        self.integral_entity = entity_bag.add_sensor(PidIntegralSensor(device_info))
+        self.integral_entity = entity_bag.add("sensor", PidIntegralSensor(device_info))
 
         # Private
         self._average_samples = average_samples
-        self._output: list[float] = []
+        # Moving average kept as a ring buffer plus a running sum, so each
+        # tick is O(1) instead of shifting a list and re-summing it
+        self._output: deque[float] = deque(maxlen=average_samples)
+        self._running_sum = 0.0
 
     def initialize(self, target_temperature: float) -> None:
         """Initialize the PID regulator with the target temperature."""
@@ -84,9 +96,11 @@ class PidRegulator(RegulatorBase):
             self.ki_entity.native_value,
             0,
             target_temperature,
-            1,
-            (-1, 1),
+            _PID_SAMPLE_TIME,
+            _PID_OUTPUT_LIMITS,
         )
+        # Bound once so each tick skips the __call__ descriptor walk
+        self._compute = self._pid.__call__
 
     @property
     def kp(self) -> float:
@@ -126,6 +140,7 @@ class PidRegulator(RegulatorBase):
         else:
             self._pid.auto_mode = False
             self._output.clear()
+            self._running_sum = 0.0
 
     @property
     def target_temperature(self) -> float:
@@ -140,39 +155,53 @@ class PidRegulator(RegulatorBase):
     def reset(self) -> None:
         """Reset the PID regulator."""
         self._pid.reset()
-        self.proportional_entity.set_native_value(self._pid.components[0])
-        self.integral_entity.set_native_value(self._pid.components[1])
+        proportional, integral, _ = self._pid.components
+        self.proportional_entity.set_native_value(proportional)
+        self.integral_entity.set_native_value(integral)
 
     def calculate_output(self, cur_temp: float):
         """Calculate the output of the PID regulator based on the current temperature."""
-        if not self.enabled:
+        if not self._pid.auto_mode:
             return
 
-        self._output.append(self._pid(cur_temp))
-        if len(self._output) > self._average_samples:
-            self._output.pop(0)
+        new = self._compute(cur_temp)
+        if len(self._output) == self._average_samples:
+            self._running_sum -= self._output[0]
+        self._output.append(new)
+        self._running_sum += new
 
-        self.proportional_entity.set_native_value(self._pid.components[0])
-        self.integral_entity.set_native_value(self._pid.components[1])
+        # components is a property that rebuilds its tuple, so read it once
+        proportional, integral, _ = self._pid.components
+        self.proportional_entity.set_native_value(proportional)
+        self.integral_entity.set_native_value(integral)
 
     @property
     def output(self) -> float:
         """Get the average output of the PID regulator."""
-        if not self._pid.auto_mode or len(self._output) == 0:
+        if not self._pid.auto_mode or not self._output:
             return 0
 
-        return sum(self._output) / len(self._output)
+        return self._running_sum / len(self._output)
 
     def handle_coeffs_changed(self):
         """Handle changes in the PID coefficients."""
-        self._pid.Kp = self.kp_entity.native_value
-        self._pid.Ki = self.ki_entity.native_value
-        self.on_coeffs_changed()
+        kp = self.kp_entity.native_value
+        ki = self.ki_entity.native_value
+        pid = self._pid
+        if pid.Kp == kp and pid.Ki == ki:
+            return
+        pid.Kp = kp
+        pid.Ki = ki
+        # Don't pay for dispatch when nobody subscribed
+        if hook := self.on_coeffs_changed:
+            hook()
 
 
 class HysteresisRegulator(RegulatorBase):
     """Hysteresis regulator."""
 
+    __slots__ = ("_enabled", "_output", "_target")
+
     _target: float
 
     def __init__(self) -> None:
@@ -190,12 +219,13 @@ class HysteresisRegulator(RegulatorBase):
 
     def calculate_output(self, cur_temp: float):
         """Calculate the output of the hysteresis regulator based on the current temperature."""
-        if not self.enabled:
+        if not self._enabled:
             return
 
-        if cur_temp <= self._target - 1:
+        target = self._target
+        if cur_temp <= target - 1:
             self._output = 0.05
-        elif cur_temp >= self._target:
+        elif cur_temp >= target:
             self._output = 0
 
     @property
@@ -243,6 +273,10 @@ class PidNumberBase(NumberBase):  # pylint: disable=hass-enforce-class-module
 
     def set_native_value(self, value: float) -> None:
         """Set the native value of the PID number entity and notify the regulator."""
+        # Writing an unchanged coefficient back (e.g. on reload) must not
+        # disturb the PID internals or fan out the changed event
+        if value == self._attr_native_value:
+            return
         super().set_native_value(value)
         self._regulator.handle_coeffs_changed()
 
@@ -2,38 +2,53 @@
 
 from datetime import timedelta
 import logging
+import time
 from typing import Any
 
+from homeassistant.const import STATE_UNAVAILABLE, STATE_UNKNOWN
 from homeassistant.core import HomeAssistant
-from homeassistant.util import dt as dt_util
 
 _LOGGER = logging.getLogger(__name__)
 
-bool_true = {"y", "yes", "true", "on"}
-bool_false = {"n", "no", "false", "off"}
+# Bound once so the polling path skips the module attribute lookup
+_monotonic = time.monotonic
+
+# Canonical casings are listed explicitly so the hot path can resolve a
+# value with one dict probe and no lowercased copy
+_BOOL_MAP = {
+    value: True
+    for value in ("y", "Y", "yes", "Yes", "YES", "true", "True", "TRUE", "on", "On", "ON")
+} | {
+    value: False
+    for value in ("n", "N", "no", "No", "NO", "false", "False", "FALSE", "off", "Off", "OFF")
+}
+bool_true = frozenset(value for value, flag in _BOOL_MAP.items() if flag)
+bool_false = frozenset(value for value, flag in _BOOL_MAP.items() if not flag)
+
+# Common during startup; filtered before any conversion is attempted
+_SENTINEL_STATES = frozenset({STATE_UNKNOWN, STATE_UNAVAILABLE})
 
 
 class SimpleAwaiter:
     """Initialize a SimpleAwaiter instance with a specified wait time."""
 
+    __slots__ = ("_deadline",)
+
     def __init__(self, wait_time: timedelta) -> None:
         """Init awaiter."""
-        start_time = dt_util.now()
-        self.target_time = start_time + wait_time
+        # A monotonic deadline makes each elapsed check a single float
+        # compare, with no datetime allocation per poll
+        self._deadline = _monotonic() + wait_time.total_seconds()
 
     @property
     def elapsed(self) -> bool:
         """Check if the elapsed time has reached the target time."""
-        return dt_util.now() >= self.target_time
+        return _monotonic() >= self._deadline
 
 
 def str_to_bool(value: str) -> bool | None:
     """Convert a string value to a boolean, returning None if the value is not recognized."""
-    if value in bool_true:
-        return True
-    if value in bool_false:
-        return False
-    return None
+    return _BOOL_MAP.get(value)
 
 
 def get_state_value(
@@ -48,9 +63,7 @@ def get_state_value(
         return default
 
     if attribute is not None:
-        if attribute in state.attributes:
-            return state.attributes[attribute]
-        return default
+        return state.attributes.get(attribute, default)
 
     return state.state
 
@@ -64,17 +77,27 @@ def get_state_bool(
     """Convert the state value of an entity to a boolean, returning None if conversion fails."""
     value = get_state_value(hass, entity, attribute, default)
 
-    try:
-        return str_to_bool(value.lower())
-    except:  # noqa: E722
-        _LOGGER.warning(
-            "Failed to get bool state for entity %s%s. Received: %s",
-            entity,
-            f".{attribute}" if attribute is not None else "",
-            value,
-        )
+    if isinstance(value, str):
+        if (result := _BOOL_MAP.get(value)) is not None:
+            return result
+        if value in _SENTINEL_STATES:
+            return default
+        # Unusual casing like "oN" still resolves after lowercasing
+        if (result := _BOOL_MAP.get(value.lower())) is not None:
+            return result
+    elif isinstance(value, bool):
+        return value
+    elif value is None:
         return None
 
+    _LOGGER.warning(
+        "Failed to get bool state for entity %s%s. Received: %s",
+        entity,
+        f".{attribute}" if attribute is not None else "",
+        value,
+    )
+    return None
+
 
 def get_state_float(
     hass: HomeAssistant,
@@ -85,11 +108,16 @@ def get_state_float(
     """Convert the state value of an entity to a float, returning None if conversion fails."""
     value = get_state_value(hass, entity, attribute, default)
 
+    # Attribute values can be any JSON type, so only strings are tested
+    # against the sentinel set (lists/dicts are unhashable)
+    if value is None or (isinstance(value, str) and value in _SENTINEL_STATES):
+        return default
+
     try:
         return float(value)
-    except:  # noqa: E722
+    except (TypeError, ValueError):
         _LOGGER.warning(
-            "Failed to get floar state for entity %s%s. Received: %s",
+            "Failed to get float state for entity %s%s. Received: %s",
             entity,
             f".{attribute}" if attribute is not None else "",
             value,
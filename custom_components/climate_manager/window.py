@@ -1,19 +1,33 @@
 """Window tracker."""
 
-from datetime import datetime, timedelta
+import time
 
 from homeassistant.components.binary_sensor import BinarySensorDeviceClass
 from homeassistant.const import EntityCategory
 from homeassistant.core import HomeAssistant
-from homeassistant.util import dt as dt_util
 
 from .common import BinarySensorBase, DeviceInfoModel, EntityBag
-from .utils import get_state_bool
+from .utils import bool_true
+
+# How long a window must stay closed before the regulator restarts
+_WARMUP_SECONDS = 5 * 60
+
+# Bound once so the per-tick deadline check skips the module attribute lookup
+_monotonic = time.monotonic
 
 
 class ZoneWindow:
     """Zone window."""
 
+    __slots__ = (
+        "_window_sensors",
+        "_hass",
+        "_state_getter",
+        "window_entity",
+        "_last_open",
+        "_warmup_time",
+    )
+
     def __init__(
         self,
         hass: HomeAssistant,
@@ -24,32 +38,50 @@ class ZoneWindow:
         """Initialize the ZoneWindow with the specified parameters."""
         self._window_sensors = window_sensors
         self._hass = hass
+        # Bound once; saves two attribute lookups per sensor per tick
+        self._state_getter = hass.states.get
 
         # Entities
-        self.window_entity = entity_bag.add_binary_sensor(ZoneWindowSensor(device_info))
+        self.window_entity = entity_bag.add("binary_sensor", ZoneWindowSensor(device_info))
 
         # State
         self._last_open = False
-        self._warmup_time: datetime | None = None
+        # Monotonic deadline; a float compare per tick instead of building
+        # timezone-aware datetimes
+        self._warmup_time: float | None = None
 
     @property
     def window_open(self) -> bool:
         """Determine if any of the window sensors indicate the window is open."""
-        result = False
+        # Inline the state reads: window sensors report plain on/off, so the
+        # get_state_bool fallbacks are dead weight here. Still short-circuits
+        # at the first open sensor.
+        get_state = self._state_getter
         for sensor in self._window_sensors:
-            result = result or (get_state_bool(self._hass, sensor) or False)
+            state = get_state(sensor)
+            if state is None:
+                continue
+            # Binary sensors report a canonical "on"; the literal compare
+            # resolves by identity on interned strings, the set is a fallback
+            value = state.state
+            if value == "on" or value in bool_true:
+                return True
 
-        return result
+        return False
 
     def should_heat(self) -> bool:
         """Determine if the regulator should be active based on the window state."""
         window_open = self.window_open
 
+        # Steady state: closed, was closed, no warmup pending
+        if not window_open and not self._last_open and self._warmup_time is None:
+            return True
+
         if self._last_open == window_open:  # There was no change
             if (
                 not window_open
                 and self._warmup_time is not None
-                and dt_util.now() >= self._warmup_time
+                and _monotonic() >= self._warmup_time
             ):
                 # Window is closed and it stayed closed for warmup time after being open
                 # We enable PID once again setting integral term to equal last output
@@ -63,7 +95,7 @@ class ZoneWindow:
                 self._warmup_time = None
             else:
                 # If the window got closed, we calculate warmup time after which we should restart PID
-                self._warmup_time = dt_util.now() + timedelta(minutes=5)
+                self._warmup_time = _monotonic() + _WARMUP_SECONDS
 
             self.window_entity.set_is_on(window_open)
 
@@ -3,7 +3,7 @@
 from collections.abc import Callable
 from datetime import timedelta
 import logging
-from typing import Any, cast
+from typing import Any
 
 from homeassistant.components.binary_sensor import BinarySensorDeviceClass
 from homeassistant.components.climate import HVACMode
@@ -26,6 +26,7 @@ from .const import (
     CONFIG_WINDOW_SENSORS,
     REGULATOR_TYPE_PID,
 )
+from .event_hook import EventHook
 from .online_tracker import OnlineTracker
 from .regulator import HysteresisRegulator, PidRegulator, RegulatorBase
 from .utils import get_state_float
@@ -33,6 +34,10 @@ from .window import ZoneWindow
 
 _LOGGER = logging.getLogger(__name__)
 
+# Enum members are singletons, so the per-tick mode check can compare
+# identity instead of StrEnum equality
+_HEAT = HVACMode.HEAT
+
 
 class Zone(ControllerBase):
     """Heating zone."""
@@ -51,57 +56,91 @@ class Zone(ControllerBase):
         # Config
         self.config_subentry = zone_config
 
-        config_data = zone_config.data.copy()
+        # Config is only read here, no need to copy it
+        data = zone_config.data
 
-        self._regulator_type = zone_config.data[CONFIG_REGULATOR_TYPE]
-        self._temp_sensor = zone_config.data[CONFIG_TEMPERATURE_SENSOR]
-        self._trvs = config_data.get(CONFIG_TRVS, [])
+        self._regulator_type = data[CONFIG_REGULATOR_TYPE]
+        self._temp_sensor = data[CONFIG_TEMPERATURE_SENSOR]
+        # Immutable and safe to embed in the prebuilt service payloads;
+        # the empty tuple is a shared singleton
+        self._trvs: tuple[str, ...] = tuple(data.get(CONFIG_TRVS) or ())
+        window_sensors = data.get(CONFIG_WINDOW_SENSORS)
         self._window: ZoneWindow | None = (
-            ZoneWindow(
-                hass,
-                config_data[CONFIG_WINDOW_SENSORS],
-                self.device_info,
-                self.entity_bag,
-            )
-            if CONFIG_WINDOW_SENSORS in config_data
-            and len(config_data[CONFIG_WINDOW_SENSORS]) > 0
+            ZoneWindow(hass, window_sensors, self.device_info, self.entity_bag)
+            if window_sensors
             else None
         )
 
         # Entities
-        self.climate_entity = self.entity_bag.add_climate(ZoneClimate(self))
-        self.sensor_fault_entity = self.entity_bag.add_binary_sensor(
-            ZoneSensorFaultSensor(self.device_info)
+        self.climate_entity = self.entity_bag.add("climate", ZoneClimate(self))
+        self.sensor_fault_entity = self.entity_bag.add(
+            "binary_sensor", ZoneSensorFaultSensor(self.device_info)
         )
-        self.control_fault_entity = self.entity_bag.add_binary_sensor(
-            ZoneControlFaultSensor(self.device_info)
+        self.control_fault_entity = self.entity_bag.add(
+            "binary_sensor", ZoneControlFaultSensor(self.device_info)
         )
-        self.output_entity = self.entity_bag.add_sensor(
-            ZoneOutputSensor(self.device_info)
+        self.output_entity = self.entity_bag.add(
+            "sensor", ZoneOutputSensor(self.device_info)
         )
         self.trv_entity = (
-            self.entity_bag.add_binary_sensor(ZoneTrvSensor(self.device_info))
+            self.entity_bag.add("binary_sensor", ZoneTrvSensor(self.device_info))
             if self._trvs
             else None
         )
-        self.regulator_active_entity = self.entity_bag.add_binary_sensor(
-            ZoneRegulatorActiveSensor(self.device_info)
+        self.regulator_active_entity = self.entity_bag.add(
+            "binary_sensor", ZoneRegulatorActiveSensor(self.device_info)
         )
 
         # Private
-        if config_data[CONFIG_REGULATOR_TYPE] == REGULATOR_TYPE_PID:
+        # The concrete PID reference is bound here once so preset and coeff
+        # handlers don't need isinstance checks
+        self._pid: PidRegulator | None = None
+        if self._regulator_type == REGULATOR_TYPE_PID:
             pid = PidRegulator(self.entity_bag, self.device_info)
             pid.on_coeffs_changed += self._handle_pid_coeffs_changed
-            self._regulator = pid
+            self._regulator = self._pid = pid
         else:
             self._regulator = HysteresisRegulator()
 
-        self._regulator_enablers: list[Callable[[], bool]] = [
-            self._climate_enabled,
-            self._no_sensor_fault,
-        ]
+        # Enabled check specialized at construction: zones without windows
+        # never pay for the window branch. Ordered cheapest first, and the
+        # 'and' chain stops at the first failing condition.
+        self._compute_enabled: Callable[[], bool]
         if self._window:
-            self._regulator_enablers.append(self._window.should_heat)
+            window_should_heat = self._window.should_heat
+            self._compute_enabled = lambda: (
+                self.climate_entity.hvac_mode is _HEAT
+                and not self.sensor_fault_entity.is_on
+                and window_should_heat()
+            )
+        else:
+            self._compute_enabled = lambda: (
+                self.climate_entity.hvac_mode is _HEAT
+                and not self.sensor_fault_entity.is_on
+            )
+
+        # Fired with the new output whenever it actually changes, so the hub
+        # can keep a running max instead of rescanning every zone each tick
+        self.on_output_changed = EventHook()
+        self._last_output = 0.0
+        # TRV commands are edge-triggered to spare the bus and TRV batteries;
+        # the two possible payloads are built once up front
+        self._last_trv_mode: str | None = None
+        # entity_id must stay a list: HA's ensure_list would wrap a tuple
+        # into a single bogus element
+        trv_list = list(self._trvs)
+        self._trv_payloads = {
+            mode: {"entity_id": trv_list, "hvac_mode": mode}
+            for mode in ("heat", "off")
+        }
+
+        self._prev_online = True
+
+        # Interpolated once; the fault path logs this every second during an
+        # outage
+        self._control_error_msg = (
+            f"Exception occured while trying to control heating in zone {self._name}"
+        )
 
         self._sensor_online_tracker = OnlineTracker(
             self.sensor_fault_entity,
@@ -131,11 +170,26 @@ class Zone(ControllerBase):
 
     async def control_temperature(self) -> None:
         """Control the temperature of the zone based on current conditions."""
+        fault_was_on = self.control_fault_entity.is_on
         try:
+            # Single state-machine read per tick; everything below works off
+            # this local
             cur_temp = self.current_temperature
-
-            # If the sensor remains offline for longer than 5 sec, fault entity will be set
-            await self._sensor_online_tracker.is_online(cur_temp is not None)
+            regulator = self._regulator
+
+            # If the sensor remains offline for longer than 5 sec, fault entity will be set.
+            # The tracker only needs to run on transitions or while it has
+            # pending work (offline wait, fault recovery); the steady online
+            # case skips the await entirely.
+            online = cur_temp is not None
+            if (
+                not online
+                or not self._prev_online
+                or self.sensor_fault_entity.is_on
+                or self._sensor_online_tracker.is_awaiting
+            ):
+                await self._sensor_online_tracker.is_online(online)
+            self._prev_online = online
 
             # If there is a fault or a window is open, we disable PID
             self._recalculate_regulator_enabled()
@@ -143,40 +197,46 @@ class Zone(ControllerBase):
             # The temp sensor can be temporarily offline, but we give it a chance to recover without pausing PID.
             if cur_temp:
                 self.climate_entity.set_current_temperature(cur_temp)
-                if self._regulator.enabled:
-                    self._regulator.calculate_output(cur_temp)
+                if regulator.enabled:
+                    regulator.calculate_output(cur_temp)
 
-            output = self._regulator.output
+            output = regulator.output
             self.output_entity.set_native_value(output)
+            if output != self._last_output:
+                self._last_output = output
+                self.on_output_changed(output)
 
-            # Operate TRVs
-            if self._trvs:
-                # If windows are open, save TRV batteries and do nothing
-                if self._regulator.enabled and (
-                    not self._window or self._window.should_heat()
-                ):
-                    await self.operate_trvs(output)
+            # Operate TRVs. The window vote is already part of the enabled
+            # computation, so an enabled regulator implies closed windows —
+            # no second should_heat poll needed to save TRV batteries.
+            if self._trvs and regulator.enabled:
+                await self.operate_trvs(output)
 
             # If we reached here, we recovered from a previous unexpected fault. Clear the fault sensor and log
-            if self.control_fault_entity.is_on:
+            if fault_was_on:
                 _LOGGER.info("Zone %s recovered from control fault", self._name)
                 self.control_fault_entity.set_is_on(False)
         except Exception:
             # Function is called every second, and we don't want to spam the logs
-            if not self.control_fault_entity.is_on:
-                _LOGGER.exception(
-                    "Exception occured while trying to control heating in zone %s",
-                    self._name,
-                )
+            if not fault_was_on:
+                _LOGGER.exception(self._control_error_msg)
                 self.control_fault_entity.set_is_on(True)
 
     async def operate_trvs(self, output: float) -> None:
         """Operate the TRVs based on the regulator output."""
+        if not self._trvs:
+            return
+
+        # One list-target call instead of a service round-trip per TRV,
+        # dispatched only when the mode actually flips
         mode = "heat" if output > 0 else "off"
-        for trv in self._trvs:
-            await self._hass.services.async_call(
-                "climate", "set_hvac_mode", {"entity_id": trv, "hvac_mode": mode}
-            )
+        if mode == self._last_trv_mode:
+            return
+        self._last_trv_mode = mode
+
+        await self._hass.services.async_call(
+            "climate", "set_hvac_mode", self._trv_payloads[mode]
+        )
 
         if self.trv_entity:
             self.trv_entity.set_is_on(output > 0)
@@ -195,21 +255,11 @@ class Zone(ControllerBase):
 
     def _recalculate_regulator_enabled(self):
         """Recalculate whether the regulator is enabled based on current conditions."""
-        result = True
-        for enabler in self._regulator_enablers:
-            result = result and enabler()
+        result = self._compute_enabled()
 
         self._regulator.enabled = result
         self.regulator_active_entity.set_is_on(result)
 
-    def _climate_enabled(self):
-        """Check if the climate entity is enabled for heating."""
-        return self.climate_entity.hvac_mode == HVACMode.HEAT
-
-    def _no_sensor_fault(self):
-        """Check if there is no sensor fault detected."""
-        return not self.sensor_fault_entity.is_on
-
     def handle_target_temperature_changed(self, value: float) -> None:
         """Handle changes in target temperature for the regulator."""
         self._regulator.target_temperature = value
@@ -217,8 +267,7 @@ class Zone(ControllerBase):
     def handle_preset_changed(self, preset: dict[str, Any]):
         """Handle changes in preset values for the PID regulator."""
         # Climate entity applies its own preset values, we just need to handle other entities
-        if isinstance(self._regulator, PidRegulator):
-            pid = cast(PidRegulator, self._regulator)
+        if (pid := self._pid) is not None:
             if (kp := preset.get("kp")) is not None:
                 pid.kp = float(kp)
             if (ki := preset.get("ki")) is not None:
@@ -232,7 +281,7 @@ class Zone(ControllerBase):
 
     def _handle_pid_coeffs_changed(self):
         """Handle changes in PID coefficients for the regulator."""
-        pid = cast(PidRegulator, self._regulator)
+        pid = self._pid
         self.climate_entity.save_pid_coeffs(pid.kp, pid.ki)
 
 
@@ -291,7 +340,7 @@ class ZoneClimate(ClimateBase, RestoreEntity):  # pylint: disable=hass-enforce-c
             return
 
         # state itself is the last hvac_mode
-        if last.state in self._attr_hvac_modes:
+        if last.state in self._hvac_modes_set:
             self._attr_hvac_mode = HVACMode(last.state)
 
         attrs = last.attributes
@@ -301,7 +350,7 @@ class ZoneClimate(ClimateBase, RestoreEntity):  # pylint: disable=hass-enforce-c
         if (tmp := attrs.get("temperature")) is not None:
             self._attr_target_temperature = float(tmp)
 
-        if (preset := attrs.get("preset_mode")) in self._attr_preset_modes:
+        if (preset := attrs.get("preset_mode")) in self._preset_modes_set:
             self._attr_preset_mode = preset
 
     @property
@@ -319,11 +368,14 @@ class ZoneClimate(ClimateBase, RestoreEntity):  # pylint: disable=hass-enforce-c
     async def async_set_temperature(self, **kwargs) -> None:
         """Set the temperature for the climate entity."""
         if (temp := kwargs.get("temperature")) is not None:
-            self._attr_target_temperature = float(temp)
-            self._set_preset_item("temperature", self._attr_target_temperature)
+            value = float(temp)
+            self._attr_target_temperature = value
+            self._set_preset_item("temperature", value)
 
-            self.async_write_ha_state()
-            self.zone.handle_target_temperature_changed(float(temp))
+            # Scheduled rather than written inline, so rapid slider drags
+            # coalesce into one state-machine write
+            self.schedule_update_ha_state()
+            self.zone.handle_target_temperature_changed(value)
 
     async def async_set_preset_mode(self, preset_mode: str) -> None:
         """Set the preset mode for the climate entity."""
@@ -342,9 +394,7 @@ class ZoneClimate(ClimateBase, RestoreEntity):  # pylint: disable=hass-enforce-c
 
     def _set_preset_item(self, key: str, value: Any):
         """Set a preset item in the preset dictionary."""
-        if self.preset_mode not in self._presets:
-            self._presets[self.preset_mode] = {}
-        self._presets[self.preset_mode][key] = value
+        self._presets.setdefault(self.preset_mode, {})[key] = value
 
     def _apply_preset(self, preset: dict[str, Any]):
         """Apply a preset to the climate entity."""